@@ -0,0 +1,102 @@
+"""
+Kernels for building the Bulls and Cows feedback table.
+Numba is optional: when it is installed the table is built by a compiled loop, otherwise with NumPy.
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Fall back to the NumPy kernel
+    numba = None
+
+# Number of set bits for every 10-bit digit-set mask
+POPCOUNT10 = np.array([bin(i).count("1") for i in range(1 << 10)], dtype=np.uint8)
+
+
+def popcount10(masks):
+    """
+    Count the set bits of every 10-bit digit-set mask.
+    Uses np.bitwise_count on NumPy 2.0 and later, and the lookup table on older versions.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks)
+    return POPCOUNT10[masks]
+
+
+def digit_masks(perms):
+    """
+    Encode every combination as a 10-bit digit set, with bit d set for every digit d it contains.
+    Args:
+        perms (np.ndarray): Combinations, shape (N, 4).
+    Returns:
+        np.ndarray: uint16 digit-set mask of each combination.
+    """
+    masks = np.zeros(len(perms), dtype=np.uint16)
+    for k in range(perms.shape[1]):
+        masks |= np.uint16(1) << perms[:, k].astype(np.uint16)
+    return masks
+
+
+def _feedback_table_numpy(perms, masks, chunk_size=256):
+    """
+    Build the feedback table with broadcasted NumPy compares, chunk_size guesses at a time to cap memory.
+    """
+    n = len(perms)
+    table = np.empty((n, n), dtype=np.uint8)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        bulls = np.zeros((stop - start, n), dtype=np.uint8)
+        for k in range(perms.shape[1]):
+            bulls += perms[start:stop, k, None] == perms[None, :, k]  # Same digit at position k
+        common = popcount10(masks[start:stop, None] & masks[None, :])  # Digits shared by guess and code
+        table[start:stop] = bulls * 5 + (common - bulls)
+    return table
+
+
+def pack_digits(perms):
+    """
+    Pack every combination into a single integer, 4 bits per digit.
+    Args:
+        perms (np.ndarray): Combinations, shape (N, 4).
+    Returns:
+        np.ndarray: uint32 packed combinations, digit k in bits 4k to 4k+3.
+    """
+    packed = np.zeros(len(perms), dtype=np.uint32)
+    for k in range(perms.shape[1]):
+        packed |= perms[:, k].astype(np.uint32) << np.uint32(4 * k)
+    return packed
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _feedback(guess, code, guess_mask, code_mask, popcount):
+        # Encoded feedback (bulls * 5 + cows) of a packed guess against a packed code, without branches
+        x = guess ^ code  # Zero nibble wherever the digits match
+        matched = ~(((x & 0x7777) + 0x7777) | x) & 0x8888  # High bit set in every zero nibble
+        bulls = (((matched >> 3) * 0x1111) >> 12) & 0xF  # Sum the four nibble flags
+        return bulls * 5 + popcount[guess_mask & code_mask] - bulls
+
+    @numba.njit(cache=True)
+    def _feedback_table_numba(packed, masks, popcount):
+        # Fill the feedback table one (guess, code) pair at a time
+        n = packed.shape[0]
+        table = np.empty((n, n), dtype=np.uint8)
+        for i in range(n):
+            for j in range(n):
+                table[i, j] = _feedback(packed[i], packed[j], masks[i], masks[j], popcount)
+        return table
+
+
+def build_feedback_table(perms):
+    """
+    Precompute the feedback of every guess against every possible code.
+    Each entry is encoded as bulls * 5 + cows, so table[i, j] is the feedback for guessing perms[i] when the code is perms[j].
+    Args:
+        perms (np.ndarray): All possible codes, shape (N, 4).
+    Returns:
+        np.ndarray: An (N, N) uint8 feedback table.
+    """
+    masks = digit_masks(perms)
+    if numba is not None:
+        return _feedback_table_numba(pack_digits(perms), masks, POPCOUNT10)
+    return _feedback_table_numpy(perms, masks)
@@ -1,87 +1,55 @@
-import random
-import math
-from itertools import permutations
+import sys
+from pathlib import Path
+import numpy as np
 import streamlit as st
 
-class BullsAndCows:
+# Streamlit runs this file as a script, put src on the path so the game is imported from the gamebot package
+SRC_DIR = str(Path(__file__).resolve().parents[1])
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from gamebot.bulls_and_cows import INITIAL_ENTROPY, VALID_GUESS, BullsAndCows  # noqa: E402
+
+# Feedback shown after a guess, only the metric values change from turn to turn
+FEEDBACK_TEMPLATE = (
+    "Bulls: {bulls}, Cows: {cows}\n\n"
+    "**Game Metrics:**\n\n"
+    "| Metric | Value |\n"
+    "| --- | --- |\n"
+    "| Entropy | {entropy:.2f} bits |\n"
+    "| Entropy Reduction | {entropy_reduction:.2f} bits |\n"
+    "| Mutual Information | {mutual_info:.2f} bits |\n\n")
+# Metric histories are preallocated float32 arrays, replaced by arrays of twice the size when a long game fills them
+HISTORY_KEYS = ("entropy_history", "entropy_reduction_history", "mutual_info_history")
+HISTORY_CAPACITY = 32
+
+
+def reset_history():
     """
-    A class to implement the Bulls and Cows game.
-    Includes functionality for entropy, entropy reduction and next guess suggestions.
+    Start new metric histories holding only the values before the first guess.
+    All histories are appended together, so they share a single length in the session state.
     """
+    for key, value in zip(HISTORY_KEYS, (INITIAL_ENTROPY, 0.0, 0.0)):
+        history = np.zeros(HISTORY_CAPACITY, dtype=np.float32)
+        history[0] = value
+        st.session_state[key] = history
+    st.session_state.history_length = 1
 
-    def __init__(self):
-        # Initialize the game with digits 0-9 and randomly generate a 4-digit secret number with unique digits.
-        self.digits = list(range(10))  # Contains digits from 0-9
-        self.secret = random.sample(self.digits, 4)  # Secret number (4 unique digits)
-        self.attempts = 0  # Tracks the no of attempts made by the player
-        self.possible_combinations = list(permutations(range(10), 4))  # All possible guesses
-        self.first_attempt = True  # Flag for the first attempt
-    
-    # Entropy calculation    
-    def calculate_entropy(self):
-        """
-        Calculate the entropy based on the number of remaining possible combinations.
-        
-        Entropy formula: H(X) = sum(P(x_i) * log2/(P(x_i)))
-        Since all possibilities are equally likely, P(x_i) = 1 / n for all i.
-        """
-        n = len(self.possible_combinations)  # No. of remaining combinations
-        if n == 0:
-            return 0  # No combinations left (edge case)
-        probabilities = [1 / n] * n  # Uniform probability distribution
-        entropy = sum(p * math.log2(1 / p) for p in probabilities)  # Formula
-        return entropy
-
-    def entropy_reduction(self, prev_entropy, current_entropy):
-        """
-        Calculate the reduction in entropy after a guess.
-        Args:
-            prev_entropy (float): Entropy before the current guess.
-            current_entropy (float): Entropy after the current guess.
-        Returns:
-            float: The difference between previous and current entropy.
-        """
-        return prev_entropy - current_entropy  
-
-    def get_feedback(self, guess, code=None):
-        """
-        Provide feedback on the number of bulls and cows for a given guess.
-        Args:
-            guess (list): The player's guessed number as a list of digits.
-            code (list): The actual secret code. Defaults to the generated secret.
-        Returns:
-            tuple: Number of bulls (correct digit and position) and cows (correct digit, wrong position).
-        """
-        if code is None:
-            code = self.secret  # Use the secret number if no code is provided
-        bulls = sum(g == s for g, s in zip(guess, code))  # Correct digit in the correct position
-        cows = sum(g == s for g in guess for s in code) - bulls  # Correct digit but in wrong position
-        return bulls, cows
-
-    def update_possibilities(self, guess, bulls, cows):
-        """
-        Update the list of possible combinations based on the feedback from the current guess.
-        Args:
-            guess (list): The player's guessed number.
-            bulls (int): Number of bulls in the guess.
-            cows (int): Number of cows in the guess.
-        """
-        new_possibilities = []
-        for combo in self.possible_combinations:
-            test_bulls, test_cows = self.get_feedback(guess, combo)
-            # Keep combinations that produce the same feedback as the player's guess
-            if (test_bulls, test_cows) == (bulls, cows):
-                new_possibilities.append(combo)
-        self.possible_combinations = new_possibilities  # Update the possibilities
-
-    def suggest_next_guesses(self):
-        """
-        Suggest up to 10 possible guesses from the remaining combinations.
-        Returns:
-            list: A list of up to 10 suggested guesses or an empty list if no combinations remain.
-        """
-        sample_size = min(10, len(self.possible_combinations))  # Limit to 10 suggestions
-        return random.sample(self.possible_combinations, sample_size) if self.possible_combinations else []  
+
+def record_history(*values):
+    """
+    Append the metrics of a guess to the histories, growing them when they are full.
+    Args:
+        *values (float): Entropy, entropy reduction and mutual information, in the order of HISTORY_KEYS.
+    """
+    length = st.session_state.history_length
+    for key, value in zip(HISTORY_KEYS, values):
+        history = st.session_state[key]
+        if length == len(history):
+            # np.resize returns a new array, its second half repeats the old values until overwritten
+            history = st.session_state[key] = np.resize(history, 2 * length)
+        history[length] = value
+    st.session_state.history_length = length + 1
 
 
 def main():
@@ -100,10 +68,8 @@ def main():
         st.session_state.game = BullsAndCows()  # initialize the game object
     if "messages" not in st.session_state:
         st.session_state.messages = []  # Store chat messages
-    if "entropy_history" not in st.session_state:
-        st.session_state.entropy_history = [st.session_state.game.calculate_entropy()]  # Track entropy values
-    if "entropy_reduction_history" not in st.session_state:
-        st.session_state.entropy_reduction_history = [0]  # Track entropy reduction values 
+    if "history_length" not in st.session_state:
+        reset_history()  # Track entropy, entropy reduction and mutual information values
     if "game_over" not in st.session_state:
         st.session_state.game_over = False  # Flag for game over
 
@@ -118,28 +84,26 @@ def main():
             st.session_state.messages.append({"role": "user", "content": user_input})
 
             # Validate user input ( must be 4 unique digits)
-            if (len(user_input) != 4
-                or not user_input.isdigit()
-                or len(set(user_input)) != 4):
+            if not VALID_GUESS.fullmatch(user_input):
                 st.session_state.messages.append(
                     {"role": "assistant",
                      "content": "Invalid guess! Please enter 4 different digits."})
             else:
-                # convert input to a list of integers
-                guess = [int(x) for x in user_input]
-                prev_entropy = st.session_state.entropy_history[-1]  # Previous entropy
+                # convert input to a tuple of integers once, it is used as is by feedback and filtering
+                guess = tuple(map(int, user_input))
+                prev_entropy = game.calculate_entropy()  # Previous entropy, from the game in full precision, the float32 histories are only charted
                 game.attempts += 1  # Increment in attempts
                 bulls, cows = game.get_feedback(guess)  # Get feedback on the guess
                 game.update_possibilities(guess, bulls, cows)  # Update remaining possibilities
 
-                # Calculate current entropy and entropy reduction
+                # Calculate current entropy, entropy reduction and the mutual information of the guess
                 entropy = game.calculate_entropy()
                 entropy_reduction = game.entropy_reduction(prev_entropy, entropy)
+                mutual_info = game.calculate_mutual_information()
 
                 # Append new entropy and entropy reduction to session state
-                st.session_state.entropy_history.append(entropy)
-                st.session_state.entropy_reduction_history.append(entropy_reduction)
-                
+                record_history(entropy, entropy_reduction, mutual_info)
+
                 # Check win 
                 if bulls == 4:
                     st.session_state.messages.append(
@@ -149,23 +113,16 @@ def main():
                 else:
                     # Display feedback and suggestions with entropy and entropy reduction in a table
                     suggestions = game.suggest_next_guesses()
-                    feedback = f"""
-                    Bulls: {bulls}, Cows: {cows} <br><br>
-                    **Game Metrics:**<br>
-                    <table>
-                        <tr><th>Metric</th><th>Value</th></tr>
-                        <tr><td>Entropy</td><td>{entropy:.2f} bits</td></tr>
-                        <tr><td>Entropy Reduction</td><td>{entropy_reduction:.2f} bits</td></tr>
-                    </table>
-                    """
-                    
+                    feedback = FEEDBACK_TEMPLATE.format(
+                        bulls=bulls, cows=cows, entropy=entropy,
+                        entropy_reduction=entropy_reduction, mutual_info=mutual_info)
+
                     # Add suggestions if available
                     if suggestions:
-                        feedback += "Suggested next guesses:<br>"
-                        feedback += ", ".join(
-                            f"{''.join(map(str, s))}" for s in suggestions)
+                        feedback += "Suggested next guesses: "
+                        feedback += ", ".join([f"{a}{b}{c}{d}" for a, b, c, d in suggestions])
                     else:
-                        feedback += "<br>No suggestions available."
+                        feedback += "No suggestions available."
 
                     # Append feedback to chat history
                     st.session_state.messages.append({"role": "assistant", "content": feedback})
@@ -173,36 +130,48 @@ def main():
     # Display chat history 
     for message in st.session_state.messages:
         with st.chat_message(message["role"]):
-            st.markdown(message["content"], unsafe_allow_html=True)
+            st.markdown(message["content"])
+
+    # Only the recorded part of the preallocated histories is charted, it always holds the values before the first guess
+    length = st.session_state.history_length
+    entropy_history = st.session_state.entropy_history[:length]
+    entropy_reduction_history = st.session_state.entropy_reduction_history[:length]
+    mutual_info_history = st.session_state.mutual_info_history[:length]
 
     # Plot entropy graph on the sidebar
-    if st.session_state.entropy_history:
-        st.sidebar.subheader("Entropy Progress")
-        st.sidebar.line_chart(
-            {"Entropy (bits)": st.session_state.entropy_history},
-            x_label="Number of Guesses",
-            y_label="Entropy (bits)")
-        current_entropy = st.session_state.entropy_history[-1]
-        st.sidebar.write(f"**Current Entropy:** {current_entropy:.2f} bits")
+    st.sidebar.subheader("Entropy Progress")
+    st.sidebar.line_chart(
+        {"Entropy (bits)": entropy_history},
+        x_label="Number of Guesses",
+        y_label="Entropy (bits)")
+    current_entropy = entropy_history[-1]
+    st.sidebar.write(f"**Current Entropy:** {current_entropy:.2f} bits")
     
     # Plot entropy reduction graph on the sidebar
-    if st.session_state.entropy_reduction_history:
-        st.sidebar.subheader("Entropy Reduction Progress")
-        st.sidebar.line_chart(
-            {"Entropy Reduction": st.session_state.entropy_reduction_history},
-            x_label="Number of Guesses",
-            y_label="Entropy Reduction")
-        current_entropy_reduce = st.session_state.entropy_reduction_history[-1]
-        st.sidebar.write(f"**Current Entropy Reduction:** {current_entropy_reduce:.2f}")
+    st.sidebar.subheader("Entropy Reduction Progress")
+    st.sidebar.line_chart(
+        {"Entropy Reduction": entropy_reduction_history},
+        x_label="Number of Guesses",
+        y_label="Entropy Reduction")
+    current_entropy_reduce = entropy_reduction_history[-1]
+    st.sidebar.write(f"**Current Entropy Reduction:** {current_entropy_reduce:.2f}")
+
+    # Plot mutual information graph on the sidebar
+    st.sidebar.subheader("Mutual Information Progress")
+    st.sidebar.line_chart(
+        {"Mutual Information (bits)": mutual_info_history},
+        x_label="Number of Guesses",
+        y_label="Mutual Information (bits)")
+    current_mutual_info = mutual_info_history[-1]
+    st.sidebar.write(f"**Current Mutual Information:** {current_mutual_info:.2f} bits")
 
     # Restart button
     if st.button("Restart Game"):
         st.session_state.game = BullsAndCows()  # Reset the game class
         st.session_state.messages = []  # clear chat history
-        st.session_state.entropy_history = [st.session_state.game.calculate_entropy()]  # Reset entropy history
-        st.session_state.entropy_reduction_history = [0]  # Reset entropy reduction history
+        reset_history()  # Reset entropy, entropy reduction and mutual information histories
         st.session_state.game_over = False  # Reset game over flag
-        st.experimental_rerun()  # Refresh the app
+        st.rerun()  # Refresh the app
 
 
 if __name__ == "__main__":
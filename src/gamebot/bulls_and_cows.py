@@ -0,0 +1,210 @@
+import math
+import re
+from functools import lru_cache
+from itertools import permutations
+import numpy as np
+from ._kernels import build_feedback_table
+
+# All 5040 possible codes (4 unique digits), one row per permutation
+PERMS = np.array(list(permutations(range(10), 4)), dtype=np.uint8)
+# Row of each code in PERMS, used to look up a guess in the feedback table
+PERM_INDEX = {perm: i for i, perm in enumerate(permutations(range(10), 4))}
+# Entropy of a fresh game, every code is still possible
+INITIAL_ENTROPY = math.log2(len(PERMS))
+# A valid guess is exactly 4 ASCII digits, the lookahead rejects any repeated digit
+VALID_GUESS = re.compile(r"(?!.*(.).*\1)[0-9]{4}")
+# Random generator used to draw secrets and break ties between suggestions
+rng = np.random.default_rng()
+
+
+def digit_mask(digits):
+    """
+    Encode a combination as a 10-bit digit set, with bit d set for every digit d it contains.
+    """
+    return sum(1 << int(d) for d in digits)
+
+
+# Feedback of every guess against every code, built once when the module is first imported
+FB = build_feedback_table(PERMS)
+# Bitset with every code set, the state of a fresh game
+ALL_CODES_BITS = np.packbits(np.ones(len(PERMS), dtype=bool))
+
+
+@lru_cache(maxsize=1024)
+def candidate_bits(guess_idx, feedback):
+    """
+    Pack the set of codes that give the encoded feedback for a guess into a bitset, one bit per code.
+    Bitsets are cached, so replaying a common opening only compares against the feedback table once.
+    Args:
+        guess_idx (int): Row of the guess in the feedback table.
+        feedback (int): Encoded feedback, bulls * 5 + cows.
+    Returns:
+        np.ndarray: Read-only packed uint8 bitset over PERMS.
+    """
+    bits = np.packbits(FB[guess_idx] == feedback)
+    bits.flags.writeable = False
+    return bits
+
+
+def counts_entropy(counts):
+    """
+    Calculate the entropy of the distributions given by histogram counts along the last axis.
+    Args:
+        counts (np.ndarray): Histogram counts, one distribution per row.
+    Returns:
+        np.ndarray: Entropy in bits of each distribution.
+    """
+    p = counts / counts.sum(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Adding 0.0 turns the -0.0 of a single-bucket histogram into 0.0
+        return np.where(p > 0, -p * np.log2(p), 0.0).sum(axis=-1) + 0.0
+
+
+def feedback_entropy(feedback):
+    """
+    Calculate the entropy of the feedback distribution for each guess.
+    This is the information a guess is expected to reveal when every remaining code is equally likely.
+    Args:
+        feedback (np.ndarray): Encoded feedback, shape (G, N), one row per guess against the N remaining codes.
+    Returns:
+        np.ndarray: Entropy in bits for each of the G guesses.
+    """
+    g = feedback.shape[0]
+    keys = feedback + 25 * np.arange(g)[:, None]  # Give every guess its own 25 feedback buckets
+    counts = np.bincount(keys.ravel(), minlength=25 * g).reshape(g, 25)
+    return counts_entropy(counts)
+
+
+class BullsAndCows:
+    """
+    A class to implement the Bulls and Cows game.
+    Includes functionality for entropy, entropy reduction and next guess suggestions.
+    """
+
+    # Fixed set of attributes, no per-instance __dict__
+    __slots__ = ("digits", "secret", "secret_mask", "attempts", "bits", "_entropy", "_mutual_info")
+
+    def __init__(self):
+        # Initialize the game with digits 0-9 and randomly generate a 4-digit secret number with unique digits.
+        self.digits = list(range(10))  # Contains digits from 0-9
+        self.secret = PERMS[rng.integers(len(PERMS))].tolist()  # Secret number (4 unique digits)
+        self.secret_mask = digit_mask(self.secret)  # Digit set of the secret, reused for every guess
+        self.attempts = 0  # Tracks the no of attempts made by the player
+        self.bits = ALL_CODES_BITS.copy()  # Bitset of the codes still consistent with the feedback so far
+        self._entropy = INITIAL_ENTROPY  # Entropy of the remaining codes, updated with the bitset
+        self._mutual_info = 0.0  # Mutual information of the last guess, updated with the bitset
+    
+    @property
+    def mask(self):
+        """
+        The remaining possible codes as a boolean mask over PERMS.
+        """
+        return np.unpackbits(self.bits, count=len(PERMS)).view(bool)
+
+    @property
+    def possible_combinations(self):
+        """
+        The remaining possible codes as a list of digit tuples.
+        The game itself works on the bitset and PERMS, the tuples are only built when this is read.
+        """
+        return [tuple(combo) for combo in PERMS[self.mask].tolist()]
+
+    # Entropy calculation    
+    def calculate_entropy(self):
+        """
+        Calculate the entropy based on the number of remaining possible combinations.
+        
+        Entropy formula: H(X) = sum(P(x_i) * log2/(P(x_i)))
+        Since all possibilities are equally likely, P(x_i) = 1 / n for all i,
+        so the sum collapses to H(X) = log2(n).
+        The value is cached and only recomputed when the possibilities are updated.
+        """
+        return self._entropy
+
+    def entropy_reduction(self, prev_entropy, current_entropy):
+        """
+        Calculate the reduction in entropy after a guess.
+        Args:
+            prev_entropy (float): Entropy before the current guess.
+            current_entropy (float): Entropy after the current guess.
+        Returns:
+            float: The difference between previous and current entropy.
+        """
+        return prev_entropy - current_entropy  
+
+    def calculate_mutual_information(self):
+        """
+        Mutual information between the last guess's feedback and the secret, before the feedback was known.
+        The feedback is a function of the secret, so I(Secret; Feedback) = H(Feedback) over the combinations
+        that remained before the guess.
+        The value is computed when the possibilities are updated, 0.0 before the first guess.
+        """
+        return self._mutual_info
+
+    def feedback_counts(self, guess_idx):
+        """
+        Count the remaining combinations that would give each encoded feedback (bulls * 5 + cows) for a guess.
+        Args:
+            guess_idx (int): Row of the guess in the feedback table.
+        Returns:
+            np.ndarray: 25 counts, indexed by encoded feedback.
+        """
+        return np.bincount(FB[guess_idx][self.mask], minlength=25)
+
+    def get_feedback(self, guess, code=None):
+        """
+        Provide feedback on the number of bulls and cows for a given guess.
+        Args:
+            guess (list): The player's guessed number as a list of digits.
+            code (list): The actual secret code. Defaults to the generated secret.
+        Returns:
+            tuple: Number of bulls (correct digit and position) and cows (correct digit, wrong position).
+        """
+        if code is None:
+            code, code_mask = self.secret, self.secret_mask  # Use the secret number if no code is provided
+        else:
+            code_mask = digit_mask(code)
+        bulls = sum(g == s for g, s in zip(guess, code))  # Correct digit in the correct position
+        if bulls == len(guess):
+            return bulls, 0  # Exact match, no cows possible
+        cows = (digit_mask(guess) & code_mask).bit_count() - bulls  # Correct digit but in wrong position
+        return bulls, cows
+
+    def update_possibilities(self, guess, bulls, cows):
+        """
+        Update the list of possible combinations based on the feedback from the current guess.
+        Args:
+            guess (tuple): The player's guessed number as a tuple of digits.
+            bulls (int): Number of bulls in the guess.
+            cows (int): Number of cows in the guess.
+        """
+        guess_idx = PERM_INDEX[tuple(guess)]  # Row of the guess in the feedback table
+        feedback = bulls * 5 + cows
+        # One pass over the remaining combinations gives the feedback distribution of the guess,
+        # used both for the remaining count and for the mutual information
+        counts = self.feedback_counts(guess_idx)
+        # Keep combinations that produce the same feedback as the player's guess
+        self.bits &= candidate_bits(guess_idx, feedback)
+        n = int(counts[feedback])  # No. of remaining combinations
+        self._entropy = math.log2(n) if n else 0.0  # No combinations left (edge case)
+        self._mutual_info = float(counts_entropy(counts))
+
+    def suggest_next_guesses(self):
+        """
+        Suggest up to 10 possible guesses from the remaining combinations.
+        Guesses are ranked by the entropy of the feedback they would produce, so the best
+        suggestions split the remaining combinations most evenly.
+        Returns:
+            list: A list of up to 10 suggested guesses as tuples of digits, or an empty list if no combinations remain.
+        """
+        mask = self.mask
+        candidates = np.flatnonzero(mask)
+        if len(candidates) <= 2:
+            # With at most 2 combinations left every guess scores the same, skip the scoring
+            return [tuple(guess) for guess in PERMS[candidates].tolist()]
+        candidates = rng.permutation(candidates)  # Shuffled to break ties randomly
+        scores = np.concatenate(
+            [feedback_entropy(FB[candidates[start:start + 256]][:, mask])
+             for start in range(0, len(candidates), 256)])
+        best = np.argsort(-scores, kind="stable")[:10]  # Limit to 10 suggestions
+        return [tuple(guess) for guess in PERMS[candidates[best]].tolist()]  # Only the 10 suggestions are turned into tuples
@@ -0,0 +1,78 @@
+import math
+from itertools import permutations
+import numpy as np
+import pytest
+from gamebot import bulls_and_cows
+from gamebot.bulls_and_cows import FB, PERM_INDEX, PERMS, VALID_GUESS, BullsAndCows, counts_entropy
+
+
+def test_counts_entropy_single_bucket_is_positive_zero():
+    counts = np.zeros(25, dtype=np.int64)
+    counts[7] = 12
+    entropy = counts_entropy(counts)
+    assert entropy == 0.0
+    assert not math.copysign(1.0, entropy) < 0  # Not -0.0, which is shown as "-0.00"
+
+
+def test_counts_entropy_uniform_buckets():
+    counts = np.array([[1, 1, 1, 1], [3, 0, 3, 0]])
+    assert np.allclose(counts_entropy(counts), [2.0, 1.0])
+
+
+def test_update_possibilities_tracks_remaining_codes():
+    game = BullsAndCows()
+    expected = set(permutations(range(10), 4))
+    for guess in [(0, 1, 2, 3), (4, 5, 6, 7)]:
+        bulls, cows = game.get_feedback(guess)
+        game.update_possibilities(guess, bulls, cows)
+        # Brute-force filter with the digit by digit feedback
+        expected = {code for code in expected
+                    if sum(g == s for g, s in zip(guess, code)) == bulls
+                    and len(set(guess) & set(code)) - bulls == cows}
+        remaining = game.possible_combinations
+        assert set(remaining) == expected
+        assert int(game.mask.sum()) == len(remaining)
+        assert game.calculate_entropy() == pytest.approx(math.log2(len(remaining)))
+
+
+def test_suggest_next_guesses_returns_top_entropy_codes():
+    game = BullsAndCows()
+    # Two guesses, so symmetry no longer gives every remaining code the same score
+    game.update_possibilities((0, 1, 2, 3), 0, 2)
+    game.update_possibilities((1, 4, 5, 6), 1, 1)
+    mask = game.mask
+    # Brute-force score of every remaining code
+    scores = {tuple(PERMS[i].tolist()): float(counts_entropy(np.bincount(FB[i][mask], minlength=25)))
+              for i in np.flatnonzero(mask)}
+    suggestions = game.suggest_next_guesses()
+    assert len(suggestions) == min(10, len(scores))
+    assert len(set(suggestions)) == len(suggestions)
+    assert all(code in scores for code in suggestions)  # Only codes consistent with the feedback
+    top = sorted(scores.values(), reverse=True)[:len(suggestions)]
+    assert sorted((scores[code] for code in suggestions), reverse=True) == pytest.approx(top)
+
+
+@pytest.mark.parametrize("codes", [[(5, 6, 7, 8)], [(1, 2, 3, 4), (9, 8, 7, 6)]])
+def test_suggest_next_guesses_returns_last_codes(codes, monkeypatch):
+    def no_scoring(feedback):
+        raise AssertionError("codes were scored")
+
+    monkeypatch.setattr(bulls_and_cows, "feedback_entropy", no_scoring)  # The shortcut skips the scoring
+    game = BullsAndCows()
+    mask = np.zeros(len(PERMS), dtype=bool)
+    mask[[PERM_INDEX[code] for code in codes]] = True
+    game.bits = np.packbits(mask)
+    assert sorted(game.suggest_next_guesses()) == sorted(codes)
+
+
+@pytest.mark.parametrize("guess, valid", [
+    ("0123", True),
+    ("0113", False),  # Repeated digit
+    ("012", False),
+    ("01234", False),
+    ("12a4", False),
+    ("\u0660\u0661\u0662\u0663", False),  # Arabic-Indic digits, accepted by str.isdigit
+    ("0123\n", False),
+])
+def test_valid_guess(guess, valid):
+    assert bool(VALID_GUESS.fullmatch(guess)) == valid
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from gamebot import _kernels
+from gamebot.bulls_and_cows import FB, PERMS
+
+# Every 7th code keeps the table builds fast while covering all feedback values
+SAMPLE = PERMS[::7]
+
+
+def naive_feedback(guess, code):
+    # The original definition of the feedback, digit by digit
+    bulls = sum(g == s for g, s in zip(guess, code))
+    cows = sum(g in code and g != s for g, s in zip(guess, code))
+    return bulls * 5 + cows
+
+
+def test_feedback_table_matches_naive_feedback():
+    rng = np.random.default_rng(0)
+    for i, j in rng.integers(len(PERMS), size=(2000, 2)):
+        assert FB[i, j] == naive_feedback(PERMS[i].tolist(), PERMS[j].tolist())
+    assert np.all(np.diag(FB) == 20)  # A code against itself is 4 bulls
+
+
+def test_numpy_table_with_bitwise_count():
+    if not hasattr(np, "bitwise_count"):
+        pytest.skip("np.bitwise_count needs NumPy 2.0")
+    table = _kernels._feedback_table_numpy(SAMPLE, _kernels.digit_masks(SAMPLE))
+    assert np.array_equal(table, FB[::7, ::7])
+
+
+def test_numpy_table_with_lookup_popcount(monkeypatch):
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    table = _kernels._feedback_table_numpy(SAMPLE, _kernels.digit_masks(SAMPLE))
+    assert np.array_equal(table, FB[::7, ::7])
+
+
+def test_numba_table_matches_numpy_table():
+    if _kernels.numba is None:
+        pytest.skip("Numba is not installed")
+    masks = _kernels.digit_masks(SAMPLE)
+    table = _kernels._feedback_table_numba(_kernels.pack_digits(SAMPLE), masks, _kernels.POPCOUNT10)
+    assert np.array_equal(table, _kernels._feedback_table_numpy(SAMPLE, masks))